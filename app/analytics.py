@@ -0,0 +1,68 @@
+import pandas as pd
+
+# Pure analytics functions shared by the dashboard and the batch CLI.
+# This module must not import any UI library.
+
+def load_student_data(file_or_df):
+    if isinstance(file_or_df, pd.DataFrame):
+        df = file_or_df
+    else:
+        df = pd.read_csv(file_or_df)
+
+    if 'Name' not in df.columns and {'First Name', 'Last Name'}.issubset(df.columns):
+        df['Name'] = df['First Name'] + ' ' + df['Last Name']
+    return df
+
+def filter_students(students, min_age=None, max_age=None):
+    filtered_students = students.copy()
+    if min_age:
+        filtered_students = filtered_students[students['Age'] >= min_age]
+    if max_age:
+        filtered_students = filtered_students[students['Age'] <= max_age]
+    return filtered_students
+
+def subject_averages(students_df, subjects):
+    avg_scores = students_df[subjects].mean().reset_index()
+    avg_scores.columns = ['Subject', 'Average Score']
+    return avg_scores
+
+def overall_averages(students_df, subjects):
+    return students_df[subjects].mean(axis=1)
+
+def classify_students(students_df, subjects, pathways):
+    pathway_classifications = {}
+    for _, student in students_df.iterrows():
+        student_subjects = set(subject for subject in subjects if student[subject] >= 70)
+        for pathway, required_subjects in pathways.items():
+            if set(required_subjects).issubset(student_subjects):
+                if pathway not in pathway_classifications:
+                    pathway_classifications[pathway] = []
+                pathway_classifications[pathway].append(student['Name'])
+
+    pathway_counts = {pathway: len(students) for pathway, students in pathway_classifications.items()}
+    return pathway_classifications, pathway_counts
+
+def generate_student_report(student_data, subjects, pathways):
+    report = f"Report for {student_data['Name']}:\n\n"
+
+    overall_average = student_data[subjects].mean()
+    report += f"Overall Performance: {overall_average:.2f}%\n\n"
+
+    strengths = [subject for subject in subjects if student_data[subject] >= 80]
+    report += "Strengths:\n"
+    for strength in strengths:
+        report += f"- {strength}: {student_data[strength]}%\n"
+    report += "\n"
+
+    weaknesses = [subject for subject in subjects if student_data[subject] < 60]
+    report += "Areas for Improvement:\n"
+    for weakness in weaknesses:
+        report += f"- {weakness}: {student_data[weakness]}%\n"
+    report += "\n"
+
+    report += "Potential Pathways:\n"
+    for pathway, required_subjects in pathways.items():
+        if all(student_data[subject] >= 70 for subject in required_subjects):
+            report += f"- {pathway}\n"
+
+    return report
@@ -0,0 +1,49 @@
+import plotly.graph_objects as go
+from reports import themes
+
+# Plotly figure builders. They return figures instead of rendering them, so
+# they can be used outside Streamlit.
+
+def build_radar_chart(student, title, theme, subjects):
+    values = [student[subject] for subject in subjects]
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatterpolar(
+        r=values,
+        theta=subjects,
+        fill='toself',
+        name=student['Name'],
+        line=dict(color='rgba(255, 65, 54, 0.8)', width=2),
+        fillcolor='rgba(255, 65, 54, 0.2)'
+    ))
+
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100],
+                tickfont=dict(size=10, color=themes[theme]["textcolor"]),
+                tickangle=45,
+                gridcolor='rgba(0, 0, 0, 0.1)' if theme == "Light" else 'rgba(255, 255, 255, 0.1)'
+            ),
+            angularaxis=dict(
+                tickfont=dict(size=10, color=themes[theme]["textcolor"]),
+                gridcolor='rgba(0, 0, 0, 0.1)' if theme == "Light" else 'rgba(255, 255, 255, 0.1)'
+            ),
+            bgcolor=themes[theme]["bgcolor"]
+        ),
+        showlegend=False,
+        title=dict(
+            text=title,
+            font=dict(size=16, color=themes[theme]["textcolor"])
+        ),
+        paper_bgcolor=themes[theme]["bgcolor"],
+        plot_bgcolor=themes[theme]["bgcolor"],
+        font=dict(color=themes[theme]["textcolor"]),
+        height=500,
+        width=700,
+        margin=dict(l=80, r=80, t=100, b=80)
+    )
+
+    return fig
@@ -1,48 +1,16 @@
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
 import plotly.express as px
-import io
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib.enums import TA_CENTER, TA_RIGHT
 from bokeh.plotting import figure
 from bokeh.models import ColumnDataSource, HoverTool
 from streamlit_bokeh_events import streamlit_bokeh_events
-from datetime import datetime
-
-# Define the possible subjects
-subjects = ["English Language", "Social Studies", "Mathematics", "Integrated Science", "Zambian Languages", "Creative and Technology Studies"]
-
-# Define student pathways
-pathways = {
-    "STEM": ["Mathematics", "Integrated Science"],
-    "Humanities and Social Sciences": ["English Language", "Social Studies"],
-    "Linguistic and Cultural Studies": ["Zambian Languages", "English Language"],
-    "Creative and Design": ["Creative and Technology Studies"],
-}
-
-# Define themes
-themes = {
-    "Light": {
-        "bgcolor": "#ffffff",
-        "textcolor": "#000000",
-        "font": "sans-serif"
-    },
-    "Dark": {
-        "bgcolor": "#1e1e1e",
-        "textcolor": "#ffffff",
-        "font": "sans-serif"
-    },
-    "Custom": {
-        "bgcolor": "#f0f0f0",
-        "textcolor": "#333333",
-        "font": "serif"
-    }
-}
+from school_config import SchoolConfig, load_config
+import analytics
+from analytics import filter_students, subject_averages, overall_averages, classify_students, generate_student_report
+from reports import themes, generate_pdf_report, export_notes_to_file
+from charts import build_radar_chart
+from validation import validate_student_data, has_table_issues, quarantine_student_data
+from similarity import SimilarityIndex, find_student_position
 
 def apply_theme(theme):
     st.markdown(f"""
@@ -78,207 +46,81 @@ def get_educator_info():
 
 @st.cache_data
 def load_student_data(file_or_df):
-    if isinstance(file_or_df, pd.DataFrame):
-        df = file_or_df
+    return analytics.load_student_data(file_or_df)
+
+def generate_radar_chart(student, title, theme, subjects):
+    st.plotly_chart(build_radar_chart(student, title, theme, subjects))
+
+@st.cache_data
+def cached_validation(students_df, subjects_version, _config):
+    return validate_student_data(students_df, list(_config.subjects))
+
+# The index is built once per dataset, subjects and comparison mode; queries
+# against it are cheap, so switching students does not rebuild anything
+@st.cache_resource
+def cached_similarity_index(students_df, subjects_version, _config, centered):
+    return SimilarityIndex(students_df, list(_config.subjects), centered=centered)
+
+def similar_students_panel(students_df, selected_student, config):
+    st.subheader("Similar Students")
+    k = st.slider("Number of similar students", 1, 10, 5)
+    centered = st.checkbox("Compare strengths and weaknesses only (ignore overall level)")
+
+    index = cached_similarity_index(students_df, config.subjects_version, config, centered)
+    position = find_student_position(index.students_df, selected_student)
+    similar = index.most_similar(position, k)
+
+    if similar.empty:
+        st.write("No other students to compare with.")
     else:
-        df = pd.read_csv(file_or_df)
-    
-    if 'Name' not in df.columns:
-        df['Name'] = df['First Name'] + ' ' + df['Last Name']
-    return df
+        st.dataframe(similar, hide_index=True)
+
+# Check the loaded data before any analysis runs. Returns the data to analyse,
+# or None when the analysis has to stop until the data is fixed.
+def check_data_quality(students_df, config):
+    issues = cached_validation(students_df, config.subjects_version, config)
+    if issues.empty:
+        return students_df
+
+    st.warning(f"Found {len(issues)} data quality issue(s) in the student data.")
+    st.dataframe(issues)
+    st.caption("Row is the student's position in the data (1 = first student, the header and blank lines are not counted). For manually entered data it is the entry number.")
+
+    if has_table_issues(issues):
+        st.error("The data is missing required columns. Please fix the file or the configured subjects before continuing.")
+        return None
+
+    if not st.checkbox("Quarantine rows with issues and continue", value=False):
+        st.error("Analysis is paused until the issues are fixed or the affected rows are quarantined.")
+        return None
+
+    clean_df, quarantined_df = quarantine_student_data(students_df, issues, list(config.subjects))
+    st.info(f"{len(quarantined_df)} row(s) quarantined, {len(clean_df)} row(s) will be analysed.")
+    st.download_button(label="Download quarantined rows", data=quarantined_df.to_csv(index=False), file_name="quarantined_rows.csv", mime='text/csv')
+    return clean_df
+
+# Derived results are cached on the configuration version hashes. The config
+# itself is passed unhashed (leading underscore), so only the parts it depends
+# on decide whether a cached result is still valid.
+@st.cache_data
+def cached_subject_averages(students_df, subjects_version, _config):
+    avg_scores = subject_averages(students_df, list(_config.subjects))
+    fig = px.bar(avg_scores, x='Subject', y='Average Score', title="Average Scores by Subject", labels={'Average Score': 'Average Score (%)'})
+    return avg_scores, fig
 
-def filter_students(students, min_age=None, max_age=None):
-    filtered_students = students.copy()
-    if min_age:
-        filtered_students = filtered_students[students['Age'] >= min_age]
-    if max_age:
-        filtered_students = filtered_students[students['Age'] <= max_age]
-    return filtered_students
+@st.cache_data
+def cached_overall_averages(students_df, subjects_version, _config):
+    return overall_averages(students_df, list(_config.subjects))
 
-def generate_radar_chart(student, title, theme, subjects):
-    values = [student[subject] for subject in subjects]
-
-    fig = go.Figure()
-
-    fig.add_trace(go.Scatterpolar(
-        r=values,
-        theta=subjects,
-        fill='toself',
-        name=student['Name'],
-        line=dict(color='rgba(255, 65, 54, 0.8)', width=2),
-        fillcolor='rgba(255, 65, 54, 0.2)'
-    ))
-
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100],
-                tickfont=dict(size=10, color=themes[theme]["textcolor"]),
-                tickangle=45,
-                gridcolor='rgba(0, 0, 0, 0.1)' if theme == "Light" else 'rgba(255, 255, 255, 0.1)'
-            ),
-            angularaxis=dict(
-                tickfont=dict(size=10, color=themes[theme]["textcolor"]),
-                gridcolor='rgba(0, 0, 0, 0.1)' if theme == "Light" else 'rgba(255, 255, 255, 0.1)'
-            ),
-            bgcolor=themes[theme]["bgcolor"]
-        ),
-        showlegend=False,
-        title=dict(
-            text=title,
-            font=dict(size=16, color=themes[theme]["textcolor"])
-        ),
-        paper_bgcolor=themes[theme]["bgcolor"],
-        plot_bgcolor=themes[theme]["bgcolor"],
-        font=dict(color=themes[theme]["textcolor"]),
-        height=500,
-        width=700,
-        margin=dict(l=80, r=80, t=100, b=80)
-    )
-
-    st.plotly_chart(fig)
-
-def classify_students(students_df, subjects, pathways):
-    pathway_classifications = {}
-    for _, student in students_df.iterrows():
-        student_subjects = set(subject for subject in subjects if student[subject] >= 70)
-        for pathway, required_subjects in pathways.items():
-            if set(required_subjects).issubset(student_subjects):
-                if pathway not in pathway_classifications:
-                    pathway_classifications[pathway] = []
-                pathway_classifications[pathway].append(student['Name'])
-    
-    pathway_counts = {pathway: len(students) for pathway, students in pathway_classifications.items()}
-    return pathway_classifications, pathway_counts
-
-def export_notes_to_file(notes):
-    output = io.StringIO()
-    for student, note in notes.items():
-        output.write(f"Notes for {student}:\n")
-        output.write(f"{note}\n\n")
-    return output.getvalue()
-
-def generate_student_report(student_data, subjects, pathways):
-    report = f"Report for {student_data['Name']}:\n\n"
-
-    overall_average = student_data[subjects].mean()
-    report += f"Overall Performance: {overall_average:.2f}%\n\n"
-
-    strengths = [subject for subject in subjects if student_data[subject] >= 80]
-    report += "Strengths:\n"
-    for strength in strengths:
-        report += f"- {strength}: {student_data[strength]}%\n"
-    report += "\n"
-
-    weaknesses = [subject for subject in subjects if student_data[subject] < 60]
-    report += "Areas for Improvement:\n"
-    for weakness in weaknesses:
-        report += f"- {weakness}: {student_data[weakness]}%\n"
-    report += "\n"
-
-    report += "Potential Pathways:\n"
-    for pathway, required_subjects in pathways.items():
-        if all(student_data[subject] >= 70 for subject in required_subjects):
-            report += f"- {pathway}\n"
-    
-    return report
+@st.cache_data
+def cached_classification(students_df, config_version, _config):
+    pathway_classifications, pathway_counts = classify_students(students_df, list(_config.subjects), _config.pathway_dict())
+    fig = px.pie(values=list(pathway_counts.values()), names=list(pathway_counts.keys()), title="Distribution of Students Across Pathways")
+    return pathway_classifications, pathway_counts, fig
 
-def generate_pdf_report(student_data, report_content, theme, subjects):
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch, leftMargin=0.5*inch, rightMargin=0.5*inch)
-    elements = []
-    
-    styles = getSampleStyleSheet()
-    styles.add(ParagraphStyle(name='Center', alignment=TA_CENTER))
-    styles.add(ParagraphStyle(name='Right', alignment=TA_RIGHT))
-    
-    # Use theme colors for PDF
-    if theme == "Dark":
-        background_color = colors.black
-        text_color = colors.white
-    elif theme == "Custom":
-        background_color = colors.HexColor(themes["Custom"]["bgcolor"])
-        text_color = colors.HexColor(themes["Custom"]["textcolor"])
-    else:  # Light theme
-        background_color = colors.white
-        text_color = colors.black
-
-    # School Logo (replace with actual logo path)
-    # elements.append(Image('path_to_school_logo.png', width=1.5*inch, height=1.5*inch))
-    # elements.append(Spacer(1, 12))
-    
-    # Header
-    elements.append(Paragraph(f"{st.session_state.educator_info['school']}", styles['Center']))
-    elements.append(Paragraph("Student Performance Report", styles['Center']))
-    elements.append(Spacer(1, 0.2*inch))
-    
-    # Student and Class Info
-    data = [
-        ["Student Name:", student_data['Name'], "Class:", st.session_state.educator_info['class']],
-        ["Academic Year:", "2023-2024", "Date:", datetime.now().strftime("%B %d, %Y")]
-    ]
-    t = Table(data, colWidths=[1.5*inch, 2.5*inch, 1.25*inch, 2.25*inch])
-    t.setStyle(TableStyle([
-        ('FONTNAME', (0,0), (-1,-1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0,0), (-1,-1), 10),
-        ('TEXTCOLOR', (0,0), (0,-1), text_color),
-        ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-    ]))
-    elements.append(t)
-    elements.append(Spacer(1, 0.2*inch))
-    
-     # Subject Scores
-    elements.append(Paragraph("Academic Performance", styles['Heading2']))
-    data = [['Subject', 'Score', 'Grade', 'Comments']] + [
-        [subject, f"{student_data[subject]}%", 
-         'A' if student_data[subject] >= 90 else 'B' if student_data[subject] >= 80 else 'C' if student_data[subject] >= 70 else 'D' if student_data[subject] >= 60 else 'F',
-         'Excellent' if student_data[subject] >= 90 else 'Good' if student_data[subject] >= 80 else 'Satisfactory' if student_data[subject] >= 70 else 'Needs Improvement' if student_data[subject] >= 60 else 'Unsatisfactory']
-        for subject in subjects
-    ]
-    t = Table(data, colWidths=[2*inch, 1*inch, 1*inch, 2.5*inch])
-    t.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,0), colors.grey),
-        ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
-        ('ALIGN', (0,0), (-1,-1), 'CENTER'),
-        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0,0), (-1,0), 12),
-        ('BOTTOMPADDING', (0,0), (-1,0), 12),
-        ('BACKGROUND', (0,1), (-1,-1), colors.beige),
-        ('TEXTCOLOR', (0,1), (-1,-1), text_color),
-        ('ALIGN', (0,1), (-1,-1), 'CENTER'),
-        ('FONTNAME', (0,1), (-1,-1), 'Helvetica'),
-        ('FONTSIZE', (0,1), (-1,-1), 10),
-        ('TOPPADDING', (0,1), (-1,-1), 6),
-        ('BOTTOMPADDING', (0,1), (-1,-1), 6),
-        ('GRID', (0,0), (-1,-1), 1, colors.black)
-    ]))
-    elements.append(t)
-    elements.append(Spacer(1, 0.2*inch))
-    
-    # Overall Performance
-    overall_average = student_data[subjects].mean()
-    elements.append(Paragraph(f"Overall Average: {overall_average:.2f}%", styles['Normal']))
-    elements.append(Spacer(1, 0.1*inch))
-    
-    # Additional Comments
-    elements.append(Paragraph("Additional Comments:", styles['Heading3']))
-    elements.append(Paragraph(report_content, styles['Normal']))
-    elements.append(Spacer(1, 0.2*inch))
-    
-    # Certification
-    elements.append(Paragraph("Certification", styles['Heading3']))
-    elements.append(Paragraph("I certify that this report has been verified and is accurate to the best of my knowledge.", styles['Italic']))
-    elements.append(Spacer(1, 0.5*inch))
-    elements.append(Paragraph("_______________________________", styles['Center']))
-    elements.append(Paragraph(f"{st.session_state.educator_info['name']}", styles['Center']))
-    elements.append(Paragraph("Class Advisor", styles['Center']))
-    
-    # Generate the PDF
-    doc.build(elements)
-    buffer.seek(0)
-    return buffer
+@st.cache_data
+def cached_student_report(student_data, config_version, _config):
+    return generate_student_report(student_data, list(_config.subjects), _config.pathway_dict())
 
 def create_bokeh_chart(students_df, subjects):
     source = ColumnDataSource(students_df)
@@ -334,46 +176,45 @@ def manual_data_entry(subjects):
 
 def manage_subjects_and_pathways():
     st.header("Manage Subjects and Pathways")
-    
+    config = st.session_state.config
+
     # Manage Subjects
     st.subheader("Subjects")
-    if 'subjects' not in st.session_state:
-        st.session_state.subjects = subjects.copy()
-    
+
     # Display current subjects and allow removal
-    for subject in st.session_state.subjects:
+    for subject in config.subjects:
         col1, col2 = st.columns([3, 1])
         col1.write(subject)
         if col2.button(f"Remove {subject}"):
-            st.session_state.subjects.remove(subject)
-            st.experimental_rerun()
-    
+            st.session_state.config = config.without_subject(subject)
+            st.rerun()
+
     # Add new subject
     new_subject = st.text_input("Add a new subject:")
-    if st.button("Add Subject") and new_subject and new_subject not in st.session_state.subjects:
-        st.session_state.subjects.append(new_subject)
-        st.experimental_rerun()
-    
+    if st.button("Add Subject") and new_subject and new_subject not in config.subjects:
+        st.session_state.config = config.with_subject(new_subject)
+        st.rerun()
+
     # Manage Pathways
     st.subheader("Pathways")
-    if 'pathways' not in st.session_state:
-        st.session_state.pathways = pathways.copy()
-    
-    # Display current pathways and allow editing
-    for pathway, subjects in st.session_state.pathways.items():
+
+    # Display current pathways and allow editing; an unchanged selection keeps
+    # the same config object, so no cached results are invalidated
+    for pathway, required_subjects in config.pathways:
         st.write(f"**{pathway}**")
-        new_subjects = st.multiselect(f"Subjects for {pathway}", st.session_state.subjects, default=subjects)
-        st.session_state.pathways[pathway] = new_subjects
-    
+        new_subjects = st.multiselect(f"Subjects for {pathway}", list(config.subjects), default=list(required_subjects))
+        config = config.with_pathway(pathway, new_subjects)
+    st.session_state.config = config
+
     # Add new pathway
     new_pathway = st.text_input("Add a new pathway:")
-    if st.button("Add Pathway") and new_pathway and new_pathway not in st.session_state.pathways:
-        st.session_state.pathways[new_pathway] = []
-        st.experimental_rerun()
+    if st.button("Add Pathway") and new_pathway and new_pathway not in config.pathway_dict():
+        st.session_state.config = config.with_pathway(new_pathway)
+        st.rerun()
 
-    return st.session_state.subjects, st.session_state.pathways
+    return st.session_state.config
 
-def manage_student_notes_and_reports(students_df, theme, subjects, pathways):
+def manage_student_notes_and_reports(students_df, theme, config):
     st.header("Student Notes and Reports")
 
     if 'student_notes' not in st.session_state:
@@ -386,7 +227,7 @@ def manage_student_notes_and_reports(students_df, theme, subjects, pathways):
     report_mode = st.radio("Choose report mode:", ["Generate Auto Report", "Write Custom Report"])
 
     if report_mode == "Generate Auto Report":
-        report = generate_student_report(student_data, subjects, pathways)
+        report = cached_student_report(student_data, config.version, config)
         st.text_area("Generated Report:", value=report, height=300, disabled=True)
 
         if st.button("Save Report"):
@@ -394,7 +235,7 @@ def manage_student_notes_and_reports(students_df, theme, subjects, pathways):
             st.success(f"Report for {selected_student} saved.", icon="✅")
 
         if st.button("Export Report as PDF"):
-            pdf_buffer = generate_pdf_report(student_data, report, theme, subjects)  # Updated this line
+            pdf_buffer = generate_pdf_report(student_data, report, theme, list(config.subjects), st.session_state.educator_info)  # Updated this line
             st.download_button(label="Download PDF", data=pdf_buffer, file_name=f"{selected_student}_report.pdf", mime='application/pdf')
     
     elif report_mode == "Write Custom Report":
@@ -407,7 +248,7 @@ def manage_student_notes_and_reports(students_df, theme, subjects, pathways):
             st.success(f"Report for {selected_student} saved.")
         
         if st.button("Export Custom Report as PDF"):
-            pdf_buffer = generate_pdf_report(student_data, updated_notes, theme, subjects)  # Updated this line
+            pdf_buffer = generate_pdf_report(student_data, updated_notes, theme, list(config.subjects), st.session_state.educator_info)  # Updated this line
             st.download_button(label="Download PDF", data=pdf_buffer, file_name=f"{selected_student}_custom_report.pdf", mime='application/pdf')
 
     return st.session_state.student_notes
@@ -441,15 +282,29 @@ def main():
     st.header(f"Welcome, {st.session_state.educator_info['name']}")
     st.subheader(f"{st.session_state.educator_info['school']} - {st.session_state.educator_info['class']}")
 
-    # Initialize subjects and pathways
-    if 'subjects' not in st.session_state:
-        st.session_state.subjects = subjects.copy()
-    if 'pathways' not in st.session_state:
-        st.session_state.pathways = pathways.copy()
+    # Initialize the subjects and pathways configuration
+    if 'config' not in st.session_state:
+        st.session_state.config = SchoolConfig()
+
+    # Load a school configuration file; only a different file replaces the
+    # current config, so edits made in the app survive reruns
+    config_file = st.sidebar.file_uploader("Upload school configuration (JSON/YAML)", type=["json", "yaml", "yml"])
+    if config_file:
+        try:
+            loaded_config = load_config(config_file)
+        except ValueError as e:
+            st.sidebar.error(f"Invalid configuration file: {e}")
+        else:
+            if st.session_state.get('loaded_config_version') != loaded_config.version:
+                st.session_state.loaded_config_version = loaded_config.version
+                st.session_state.config = loaded_config
 
     # Manage subjects and pathways
     if st.sidebar.checkbox("Manage Subjects and Pathways"):
-        st.session_state.subjects, st.session_state.pathways = manage_subjects_and_pathways()
+        manage_subjects_and_pathways()
+
+    config = st.session_state.config
+    subjects = list(config.subjects)
 
     # Data input option
     data_input_option = st.radio("Choose data input method:", ["Upload CSV", "Manual Entry"])
@@ -460,7 +315,10 @@ def main():
         if uploaded_file:
             students_df = load_student_data(uploaded_file)
     else:
-        students_df = manual_data_entry(st.session_state.subjects)
+        students_df = manual_data_entry(subjects)
+
+    if students_df is not None:
+        students_df = check_data_quality(students_df, config)
 
     if students_df is not None:
         # Dashboard options
@@ -468,34 +326,35 @@ def main():
 
         if option == "Overview":
             st.header("Class Overview")
-            avg_scores = students_df[st.session_state.subjects].mean().reset_index()
-            avg_scores.columns = ['Subject', 'Average Score']
-            fig = px.bar(avg_scores, x='Subject', y='Average Score', title="Average Scores by Subject", labels={'Average Score': 'Average Score (%)'})
+            avg_scores, fig = cached_subject_averages(students_df, config.subjects_version, config)
             st.plotly_chart(fig)
 
         elif option == "Individual Student Analysis":
             st.header("Individual Student Analysis")
             selected_student = st.selectbox("Select a student:", students_df['Name'].tolist())
             student_data = students_df[students_df['Name'] == selected_student].iloc[0]
-            generate_radar_chart(student_data, f"Performance of {selected_student}", selected_theme, st.session_state.subjects)
+            chart_col, similar_col = st.columns([3, 2])
+            with chart_col:
+                generate_radar_chart(student_data, f"Performance of {selected_student}", selected_theme, subjects)
+            with similar_col:
+                similar_students_panel(students_df, selected_student, config)
 
         elif option == "Classify Students into Pathways":
             st.header("Classify Students into Pathways")
-            pathway_classifications, pathway_counts = classify_students(students_df, st.session_state.subjects, st.session_state.pathways)
+            pathway_classifications, pathway_counts, fig = cached_classification(students_df, config.version, config)
 
             for pathway, students in pathway_classifications.items():
                 st.write(f"**{pathway}**: {', '.join(students)}")
 
-            fig = px.pie(values=list(pathway_counts.values()), names=list(pathway_counts.keys()), title="Distribution of Students Across Pathways")
             st.plotly_chart(fig)
 
         elif option == "Student Notes and Reports":
-            manage_student_notes_and_reports(students_df, selected_theme, st.session_state.subjects, st.session_state.pathways)
+            manage_student_notes_and_reports(students_df, selected_theme, config)
         
         elif option == "At-Risk Students":
             st.header("At-Risk Students")
 
-            students_df['Overall Average'] = students_df[st.session_state.subjects].mean(axis=1)
+            students_df['Overall Average'] = cached_overall_averages(students_df, config.subjects_version, config)
 
             risk_threshold = st.slider("Set at-risk threshold", 0, 100, 60)
 
@@ -504,18 +363,18 @@ def main():
             st.write(f"Number of at-risk students: {len(at_risk_students)}")
             
             if not at_risk_students.empty:
-                st.dataframe(at_risk_students[['Name', 'Age', 'Overall Average'] + st.session_state.subjects])
+                st.dataframe(at_risk_students[['Name', 'Age', 'Overall Average'] + subjects])
                 
                 selected_student = st.selectbox("Select a student for detailed view:", at_risk_students['Name'])
                 student_data = at_risk_students[at_risk_students['Name'] == selected_student].iloc[0]
-                generate_radar_chart(student_data, f"Subject Performance - {selected_student}", selected_theme, st.session_state.subjects)
+                generate_radar_chart(student_data, f"Subject Performance - {selected_student}", selected_theme, subjects)
             else:
                 st.write("No at-risk students found.")
 
         elif option == "Excelling Students":
             st.header("Excelling Students")
 
-            students_df['Overall Average'] = students_df[st.session_state.subjects].mean(axis=1)
+            students_df['Overall Average'] = cached_overall_averages(students_df, config.subjects_version, config)
 
             excel_threshold = st.slider("Set excelling threshold", 0, 100, 90)
 
@@ -524,11 +383,11 @@ def main():
             st.write(f"Number of excelling students: {len(excelling_students)}")
             
             if not excelling_students.empty:
-                st.dataframe(excelling_students[['Name', 'Age', 'Overall Average'] + st.session_state.subjects])
+                st.dataframe(excelling_students[['Name', 'Age', 'Overall Average'] + subjects])
                 
                 selected_student = st.selectbox("Select a student for detailed view:", excelling_students['Name'])
                 student_data = excelling_students[excelling_students['Name'] == selected_student].iloc[0]
-                generate_radar_chart(student_data, f"Subject Performance - {selected_student}", selected_theme, st.session_state.subjects)
+                generate_radar_chart(student_data, f"Subject Performance - {selected_student}", selected_theme, subjects)
             else:
                 st.write("No excelling students found.")
 
@@ -0,0 +1,133 @@
+import io
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.lib.enums import TA_CENTER, TA_RIGHT
+from datetime import datetime
+
+# Report generation shared by the dashboard and the batch CLI.
+# This module must not import any UI library.
+
+# Define themes
+themes = {
+    "Light": {
+        "bgcolor": "#ffffff",
+        "textcolor": "#000000",
+        "font": "sans-serif"
+    },
+    "Dark": {
+        "bgcolor": "#1e1e1e",
+        "textcolor": "#ffffff",
+        "font": "sans-serif"
+    },
+    "Custom": {
+        "bgcolor": "#f0f0f0",
+        "textcolor": "#333333",
+        "font": "serif"
+    }
+}
+
+def export_notes_to_file(notes):
+    output = io.StringIO()
+    for student, note in notes.items():
+        output.write(f"Notes for {student}:\n")
+        output.write(f"{note}\n\n")
+    return output.getvalue()
+
+def generate_pdf_report(student_data, report_content, theme, subjects, educator_info):
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch, leftMargin=0.5*inch, rightMargin=0.5*inch)
+    elements = []
+    
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(name='Center', alignment=TA_CENTER))
+    styles.add(ParagraphStyle(name='Right', alignment=TA_RIGHT))
+    
+    # Use theme colors for PDF
+    if theme == "Dark":
+        background_color = colors.black
+        text_color = colors.white
+    elif theme == "Custom":
+        background_color = colors.HexColor(themes["Custom"]["bgcolor"])
+        text_color = colors.HexColor(themes["Custom"]["textcolor"])
+    else:  # Light theme
+        background_color = colors.white
+        text_color = colors.black
+
+    # School Logo (replace with actual logo path)
+    # elements.append(Image('path_to_school_logo.png', width=1.5*inch, height=1.5*inch))
+    # elements.append(Spacer(1, 12))
+    
+    # Header
+    elements.append(Paragraph(f"{educator_info['school']}", styles['Center']))
+    elements.append(Paragraph("Student Performance Report", styles['Center']))
+    elements.append(Spacer(1, 0.2*inch))
+    
+    # Student and Class Info
+    data = [
+        ["Student Name:", student_data['Name'], "Class:", educator_info['class']],
+        ["Academic Year:", "2023-2024", "Date:", datetime.now().strftime("%B %d, %Y")]
+    ]
+    t = Table(data, colWidths=[1.5*inch, 2.5*inch, 1.25*inch, 2.25*inch])
+    t.setStyle(TableStyle([
+        ('FONTNAME', (0,0), (-1,-1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0,0), (-1,-1), 10),
+        ('TEXTCOLOR', (0,0), (0,-1), text_color),
+        ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+    ]))
+    elements.append(t)
+    elements.append(Spacer(1, 0.2*inch))
+    
+     # Subject Scores
+    elements.append(Paragraph("Academic Performance", styles['Heading2']))
+    data = [['Subject', 'Score', 'Grade', 'Comments']] + [
+        [subject, f"{student_data[subject]}%", 
+         'A' if student_data[subject] >= 90 else 'B' if student_data[subject] >= 80 else 'C' if student_data[subject] >= 70 else 'D' if student_data[subject] >= 60 else 'F',
+         'Excellent' if student_data[subject] >= 90 else 'Good' if student_data[subject] >= 80 else 'Satisfactory' if student_data[subject] >= 70 else 'Needs Improvement' if student_data[subject] >= 60 else 'Unsatisfactory']
+        for subject in subjects
+    ]
+    t = Table(data, colWidths=[2*inch, 1*inch, 1*inch, 2.5*inch])
+    t.setStyle(TableStyle([
+        ('BACKGROUND', (0,0), (-1,0), colors.grey),
+        ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
+        ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0,0), (-1,0), 12),
+        ('BOTTOMPADDING', (0,0), (-1,0), 12),
+        ('BACKGROUND', (0,1), (-1,-1), colors.beige),
+        ('TEXTCOLOR', (0,1), (-1,-1), text_color),
+        ('ALIGN', (0,1), (-1,-1), 'CENTER'),
+        ('FONTNAME', (0,1), (-1,-1), 'Helvetica'),
+        ('FONTSIZE', (0,1), (-1,-1), 10),
+        ('TOPPADDING', (0,1), (-1,-1), 6),
+        ('BOTTOMPADDING', (0,1), (-1,-1), 6),
+        ('GRID', (0,0), (-1,-1), 1, colors.black)
+    ]))
+    elements.append(t)
+    elements.append(Spacer(1, 0.2*inch))
+    
+    # Overall Performance
+    overall_average = student_data[subjects].mean()
+    elements.append(Paragraph(f"Overall Average: {overall_average:.2f}%", styles['Normal']))
+    elements.append(Spacer(1, 0.1*inch))
+    
+    # Additional Comments
+    elements.append(Paragraph("Additional Comments:", styles['Heading3']))
+    elements.append(Paragraph(report_content, styles['Normal']))
+    elements.append(Spacer(1, 0.2*inch))
+    
+    # Certification
+    elements.append(Paragraph("Certification", styles['Heading3']))
+    elements.append(Paragraph("I certify that this report has been verified and is accurate to the best of my knowledge.", styles['Italic']))
+    elements.append(Spacer(1, 0.5*inch))
+    elements.append(Paragraph("_______________________________", styles['Center']))
+    elements.append(Paragraph(f"{educator_info['name']}", styles['Center']))
+    elements.append(Paragraph("Class Advisor", styles['Center']))
+    
+    # Generate the PDF
+    doc.build(elements)
+    buffer.seek(0)
+    return buffer
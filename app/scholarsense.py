@@ -0,0 +1,165 @@
+import argparse
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from analytics import load_student_data, overall_averages, classify_students, generate_student_report
+from reports import themes, generate_pdf_report
+from school_config import SchoolConfig, load_config
+from validation import validate_student_data, has_table_issues, quarantine_student_data
+
+# Headless command line entry point for nightly school-wide jobs. It only uses
+# the pure analytics and report modules, so no UI library is imported.
+#
+#   python app/scholarsense.py batch --input data --reports pdf --workers 4
+
+REPORT_FORMATS = ("pdf", "txt")
+
+def _safe_file_name(text):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", str(text)).strip("_")
+
+# Process a single class CSV: write one report per student and return a summary row
+def process_class_file(path, output_dir, report_formats, config, educator_info, theme, risk_threshold=60, excel_threshold=90):
+    class_name = os.path.splitext(os.path.basename(path))[0]
+    students_df = load_student_data(path)
+    subjects = list(config.subjects)
+    pathways = config.pathway_dict()
+
+    class_info = dict(educator_info)
+    class_info["class"] = class_info.get("class") or class_name
+
+    class_dir = os.path.join(output_dir, class_name)
+    if report_formats:
+        os.makedirs(class_dir, exist_ok=True)
+
+    # Fail fast on unusable files and quarantine bad rows before any analysis
+    issues = validate_student_data(students_df, subjects)
+    if has_table_issues(issues):
+        missing = ", ".join(issues.loc[issues["Row"].isna(), "Column"])
+        raise ValueError(f"missing required columns: {missing}")
+    quarantined_rows = 0
+    if not issues.empty:
+        students_df, quarantined_df = quarantine_student_data(students_df, issues, subjects)
+        quarantined_rows = len(quarantined_df)
+        os.makedirs(class_dir, exist_ok=True)
+        issues.to_csv(os.path.join(class_dir, "issues.csv"), index=False)
+        quarantined_df.to_csv(os.path.join(class_dir, "quarantined_rows.csv"), index=False)
+
+    for index, student in students_df.iterrows():
+        report = generate_student_report(student, subjects, pathways)
+        student_id = student["Register Number"] if "Register Number" in students_df.columns else index + 1
+        base_name = os.path.join(class_dir, _safe_file_name(f"{student_id}_{student['Name']}"))
+
+        if "txt" in report_formats:
+            with open(base_name + ".txt", "w", encoding="utf-8") as f:
+                f.write(report)
+        if "pdf" in report_formats:
+            pdf_buffer = generate_pdf_report(student, report.replace("\n", "<br/>"), theme, subjects, class_info)
+            with open(base_name + ".pdf", "wb") as f:
+                f.write(pdf_buffer.getvalue())
+
+    averages = overall_averages(students_df, subjects)
+    _, pathway_counts = classify_students(students_df, subjects, pathways)
+
+    summary = {
+        "File": os.path.basename(path),
+        "Students": len(students_df),
+        "Quarantined Rows": quarantined_rows,
+        "Class Average": round(averages.mean(), 2),
+        "At-Risk Students": int((averages < risk_threshold).sum()),
+        "Excelling Students": int((averages >= excel_threshold).sum()),
+    }
+    for pathway in pathways:
+        summary[pathway] = pathway_counts.get(pathway, 0)
+    return summary
+
+def run_batch(args):
+    if not os.path.isdir(args.input):
+        print(f"Input directory not found: {args.input}", file=sys.stderr)
+        return 2
+
+    files = sorted(os.path.join(args.input, name) for name in os.listdir(args.input) if name.lower().endswith(".csv"))
+    if not files:
+        print(f"No CSV files found in {args.input}", file=sys.stderr)
+        return 2
+
+    try:
+        config = load_config(args.config) if args.config else SchoolConfig()
+    except (OSError, ValueError) as e:
+        print(f"Invalid configuration file {args.config}: {e}", file=sys.stderr)
+        return 2
+    report_formats = tuple(fmt for fmt in args.reports.split(",") if fmt) if args.reports else ()
+    unknown = [fmt for fmt in report_formats if fmt not in REPORT_FORMATS]
+    if unknown:
+        print(f"Unknown report format(s): {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    educator_info = {"name": args.educator, "school": args.school, "class": args.class_name}
+    os.makedirs(args.output, exist_ok=True)
+
+    summaries = []
+    failures = 0
+    task_args = (args.output, report_formats, config, educator_info, args.theme)
+
+    if args.workers == 1:
+        results = []
+        for path in files:
+            try:
+                results.append((path, process_class_file(path, *task_args), None))
+            except Exception as e:
+                results.append((path, None, e))
+    else:
+        results = []
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            futures = {executor.submit(process_class_file, path, *task_args): path for path in files}
+            for future in as_completed(futures):
+                try:
+                    results.append((futures[future], future.result(), None))
+                except Exception as e:
+                    results.append((futures[future], None, e))
+
+    for path, summary, error in results:
+        if error is not None:
+            failures += 1
+            print(f"Failed to process {path}: {error}", file=sys.stderr)
+        else:
+            summaries.append(summary)
+
+    if summaries:
+        summary_df = pd.DataFrame(summaries).sort_values("File")
+        summary_path = os.path.join(args.output, "summary.csv")
+        summary_df.to_csv(summary_path, index=False)
+        print(f"Processed {len(summaries)} file(s), summary written to {summary_path}")
+
+    return 1 if failures else 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="scholarsense", description="ScholarSense headless tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    batch = commands.add_parser("batch", help="Analyse a directory of class CSV files and generate reports")
+    batch.add_argument("--input", required=True, help="Directory containing class CSV files")
+    batch.add_argument("--output", default="reports", help="Directory to write reports and summary.csv to")
+    batch.add_argument("--reports", default="", help=f"Comma separated report formats to generate ({', '.join(REPORT_FORMATS)})")
+    batch.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes")
+    batch.add_argument("--config", help="School configuration file (JSON/YAML)")
+    batch.add_argument("--theme", default="Light", choices=list(themes.keys()), help="Colour theme for PDF reports")
+    batch.add_argument("--school", default="", help="School name printed on reports")
+    batch.add_argument("--educator", default="", help="Educator name printed on reports")
+    batch.add_argument("--class-name", default="", help="Class printed on reports (defaults to the file name)")
+    batch.set_defaults(func=run_batch)
+
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if getattr(args, "workers", 1) < 1:
+        print("--workers must be at least 1", file=sys.stderr)
+        return 2
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+
+# Define the default subjects
+DEFAULT_SUBJECTS = ("English Language", "Social Studies", "Mathematics", "Integrated Science", "Zambian Languages", "Creative and Technology Studies")
+
+# Define the default student pathways
+DEFAULT_PATHWAYS = (
+    ("STEM", ("Mathematics", "Integrated Science")),
+    ("Humanities and Social Sciences", ("English Language", "Social Studies")),
+    ("Linguistic and Cultural Studies", ("Zambian Languages", "English Language")),
+    ("Creative and Design", ("Creative and Technology Studies",)),
+)
+
+def _hash_payload(payload):
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()[:16]
+
+# Immutable subjects/pathways configuration. Every edit returns a new object with
+# a new version hash, so cached results keyed on the hash are invalidated exactly
+# when the configuration they depend on changes.
+@dataclass(frozen=True)
+class SchoolConfig:
+    subjects: tuple = DEFAULT_SUBJECTS
+    pathways: tuple = DEFAULT_PATHWAYS
+    subjects_version: str = field(init=False, compare=False)
+    version: str = field(init=False, compare=False)
+
+    def __post_init__(self):
+        pathways = self.pathways.items() if isinstance(self.pathways, dict) else self.pathways
+        object.__setattr__(self, "subjects", tuple(self.subjects))
+        object.__setattr__(self, "pathways", tuple((name, tuple(required)) for name, required in pathways))
+
+        # Averages only depend on the subjects, classification also on the pathways
+        object.__setattr__(self, "subjects_version", _hash_payload(list(self.subjects)))
+        object.__setattr__(self, "version", _hash_payload({
+            "subjects": list(self.subjects),
+            "pathways": [[name, list(required)] for name, required in self.pathways],
+        }))
+
+    def pathway_dict(self):
+        # Fresh lists every call, so callers can never mutate the configuration
+        return {name: list(required) for name, required in self.pathways}
+
+    def with_subject(self, subject):
+        if subject in self.subjects:
+            return self
+        return SchoolConfig(self.subjects + (subject,), self.pathways)
+
+    def without_subject(self, subject):
+        subjects = tuple(s for s in self.subjects if s != subject)
+        pathways = tuple((name, tuple(s for s in required if s != subject)) for name, required in self.pathways)
+        return SchoolConfig(subjects, pathways)
+
+    def with_pathway(self, pathway, required_subjects=()):
+        required_subjects = tuple(required_subjects)
+        pathways = dict(self.pathways)
+        if pathways.get(pathway) == required_subjects:
+            return self
+        pathways[pathway] = required_subjects
+        return SchoolConfig(self.subjects, pathways)
+
+    def to_dict(self):
+        return {"subjects": list(self.subjects), "pathways": self.pathway_dict()}
+
+def config_from_dict(data):
+    if not isinstance(data, dict):
+        raise ValueError("The configuration must be a mapping with 'subjects' and 'pathways'")
+
+    subjects = data.get("subjects", list(DEFAULT_SUBJECTS))
+    if not isinstance(subjects, list) or not all(isinstance(s, str) for s in subjects):
+        raise ValueError("'subjects' must be a list of subject names")
+
+    # Without a 'pathways' key, keep the default pathways that only use the
+    # configured subjects
+    pathways = data.get("pathways", {
+        name: list(required) for name, required in DEFAULT_PATHWAYS if set(required).issubset(subjects)
+    })
+    if not isinstance(pathways, dict):
+        raise ValueError("'pathways' must map pathway names to lists of subjects")
+
+    for pathway, required_subjects in pathways.items():
+        if not isinstance(required_subjects, list) or not all(isinstance(s, str) for s in required_subjects):
+            raise ValueError(f"Pathway '{pathway}' must be a list of subject names")
+        unknown = [s for s in required_subjects if s not in subjects]
+        if unknown:
+            raise ValueError(f"Pathway '{pathway}' uses unknown subjects: {', '.join(unknown)}")
+
+    return SchoolConfig(subjects, pathways)
+
+# Load a school configuration from a JSON or YAML file (path or uploaded file object)
+def load_config(path_or_file):
+    if isinstance(path_or_file, (str, os.PathLike)):
+        name = os.fspath(path_or_file)
+        with open(name, encoding="utf-8") as f:
+            text = f.read()
+    else:
+        name = getattr(path_or_file, "name", "")
+        text = path_or_file.read()
+        if isinstance(text, bytes):
+            text = text.decode("utf-8")
+
+    if name.lower().endswith((".yaml", ".yml")):
+        import yaml
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML: {e}") from e
+        if data is None:
+            data = {}
+    else:
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON: {e}") from e
+
+    return config_from_dict(data)
@@ -0,0 +1,56 @@
+import numpy as np
+
+# Nearest-neighbour search over per-subject score vectors, used to find peers
+# with similar strengths and weaknesses. Small classes use exact vectorized
+# distances; larger datasets use a KD-tree (exact, and fast for the handful
+# of subject dimensions we have). This module must not import any UI library.
+
+EXACT_SEARCH_LIMIT = 5000
+
+class SimilarityIndex:
+    def __init__(self, students_df, subjects, centered=False, exact_search_limit=EXACT_SEARCH_LIMIT):
+        self.students_df = students_df.reset_index(drop=True)
+        self.subjects = list(subjects)
+        self.scores = self.students_df[self.subjects].to_numpy(dtype=np.float64)
+
+        # Centering removes each student's overall level, so only the shape of
+        # the profile (relative strengths and weaknesses) is compared
+        self.vectors = self.scores - self.scores.mean(axis=1, keepdims=True) if centered else self.scores
+
+        self.tree = None
+        if len(self.vectors) > exact_search_limit:
+            try:
+                from sklearn.neighbors import KDTree
+            except ImportError:
+                pass
+            else:
+                self.tree = KDTree(self.vectors)
+
+    def _exact_search(self, vector, k):
+        distances = np.sqrt(((self.vectors - vector) ** 2).sum(axis=1))
+        k = min(k, len(distances))
+        nearest = np.argpartition(distances, k - 1)[:k]
+        nearest = nearest[np.argsort(distances[nearest], kind="stable")]
+        return nearest, distances[nearest]
+
+    def _search(self, vector, k):
+        if self.tree is None:
+            return self._exact_search(vector, k)
+        distances, nearest = self.tree.query(vector.reshape(1, -1), k=min(k, len(self.vectors)))
+        return nearest[0], distances[0]
+
+    # Return the k students most similar to the student at the given row position
+    def most_similar(self, position, k=5):
+        nearest, distances = self._search(self.vectors[position], k + 1)
+
+        # Drop the student themselves; with identical profiles they may not come first
+        keep = nearest != position
+        nearest, distances = nearest[keep][:k], distances[keep][:k]
+
+        similar = self.students_df.iloc[nearest][['Name'] + self.subjects].copy()
+        similar.insert(1, 'Distance', distances.round(2))
+        return similar.reset_index(drop=True)
+
+def find_student_position(students_df, name):
+    positions = np.flatnonzero((students_df['Name'] == name).to_numpy())
+    return int(positions[0]) if len(positions) else None
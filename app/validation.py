@@ -0,0 +1,71 @@
+import pandas as pd
+
+# Data quality checks run once at load time, before any analysis. All checks
+# are vectorized over the whole table; issues are returned as one compact
+# DataFrame with a row per problem. This module must not import any UI library.
+
+# 'Row' is the 1-based data row: the header and blank lines are not counted and
+# a quoted multi-line field is one row. For manually entered data it is the
+# student's entry number, there is no file line.
+ISSUE_COLUMNS = ['Row', 'Register Number', 'Column', 'Issue', 'Value']
+
+def _cell_issues(mask, values, students_df, issue):
+    # Turn a boolean row x column mask into one issue row per flagged cell
+    rows, columns = mask.to_numpy().nonzero()
+    if len(rows) == 0:
+        return None
+    return pd.DataFrame({
+        'Row': rows + 1,
+        'Register Number': students_df['Register Number'].to_numpy()[rows] if 'Register Number' in students_df.columns else None,
+        'Column': mask.columns.to_numpy()[columns],
+        'Issue': issue,
+        'Value': values.to_numpy()[rows, columns].astype(str),
+    })
+
+def validate_student_data(students_df, subjects, min_score=0, max_score=100):
+    issues = []
+
+    # Missing columns are table-level issues (no row number)
+    missing_subjects = [subject for subject in subjects if subject not in students_df.columns]
+    for subject in missing_subjects:
+        issues.append(pd.DataFrame([{'Column': subject, 'Issue': 'Missing subject column'}]))
+    if 'Name' not in students_df.columns and not {'First Name', 'Last Name'}.issubset(students_df.columns):
+        issues.append(pd.DataFrame([{'Column': 'Name', 'Issue': 'Missing name columns'}]))
+
+    present_subjects = [subject for subject in subjects if subject in students_df.columns]
+    if present_subjects:
+        raw_scores = students_df[present_subjects]
+        scores = raw_scores.apply(pd.to_numeric, errors='coerce')
+
+        issues.append(_cell_issues(raw_scores.isna(), raw_scores, students_df, 'Missing score'))
+        issues.append(_cell_issues(scores.isna() & raw_scores.notna(), raw_scores, students_df, 'Non-numeric score'))
+        issues.append(_cell_issues((scores < min_score) | (scores > max_score), raw_scores, students_df, f'Score outside {min_score}-{max_score}'))
+
+    if 'Register Number' in students_df.columns:
+        # Only later copies are flagged, so quarantine keeps the first occurrence
+        duplicated = students_df[['Register Number']].duplicated(keep='first') & students_df['Register Number'].notna()
+        issues.append(_cell_issues(duplicated.to_frame('Register Number'), students_df[['Register Number']], students_df, 'Duplicate Register Number'))
+
+    if 'Name' in students_df.columns:
+        missing_name = students_df['Name'].isna() | (students_df['Name'].astype(str).str.strip() == '')
+        issues.append(_cell_issues(missing_name.to_frame('Name'), students_df[['Name']], students_df, 'Missing name'))
+
+    issues = [issue for issue in issues if issue is not None]
+    if not issues:
+        return pd.DataFrame(columns=ISSUE_COLUMNS)
+    return pd.concat(issues, ignore_index=True).reindex(columns=ISSUE_COLUMNS)
+
+def has_table_issues(issues):
+    return issues['Row'].isna().any()
+
+# Split the data into clean rows and quarantined rows. Subject scores in the
+# clean rows are converted to numbers so the analysis can rely on them.
+def quarantine_student_data(students_df, issues, subjects):
+    bad_rows = issues['Row'].dropna().astype(int).unique() - 1
+    bad_mask = pd.Series(False, index=students_df.index)
+    bad_mask.iloc[bad_rows] = True
+
+    clean_df = students_df[~bad_mask].copy()
+    present_subjects = [subject for subject in subjects if subject in clean_df.columns]
+    clean_df[present_subjects] = clean_df[present_subjects].apply(pd.to_numeric)
+    return clean_df, students_df[bad_mask]
@@ -1,30 +1,212 @@
+import argparse
+import glob
+import json
+import os
+import re
+import time
+
+import joblib
+import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.linear_model import SGDClassifier
+from sklearn.metrics import confusion_matrix
 from sklearn.naive_bayes import GaussianNB
-from sklearn.metrics import classification_report
+from sklearn.preprocessing import StandardScaler
+
+# Out-of-core training pipeline. Class files are streamed in chunks and the
+# model is updated with partial_fit, so memory use depends on the chunk size
+# rather than on the number of files. Cross-validation folds are groups of
+# whole files and are trained in parallel. Models that need standardised
+# features get a StandardScaler fitted in an earlier streaming pass.
+#
+#   python models/train_model.py --data-dir data --folds 5 --jobs -1
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+# Columns that are not used as features
+DROP_COLUMNS = ["Register Number", "First Name", "Last Name", "Age", "Name"]
+
+# Estimators that support incremental training with partial_fit, and whether
+# they need standardised features
+MODELS = {
+    "gaussian_nb": (lambda: GaussianNB(), False),
+    "sgd": (lambda: SGDClassifier(loss="log_loss", random_state=42), True),
+}
+
+def _natural_key(path):
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", os.path.basename(path))]
+
+def find_class_files(data_dir, pattern):
+    return sorted(glob.glob(os.path.join(data_dir, pattern)), key=_natural_key)
+
+# Step 1: Stream the data. Rows without a label are skipped; a missing or
+# non-numeric feature value stops the run with the file and data row.
+def read_training_chunks(path, target, feature_columns, chunksize):
+    for chunk in pd.read_csv(path, usecols=feature_columns + [target], chunksize=chunksize):
+        chunk = chunk.dropna(subset=[target])
+        if chunk.empty:
+            continue
+        features = chunk[feature_columns].apply(pd.to_numeric, errors="coerce")
+        bad_rows = features.isna().any(axis=1)
+        if bad_rows.any():
+            rows = ", ".join(str(row + 1) for row in chunk.index[bad_rows][:5])
+            raise ValueError(f"{path}: missing or non-numeric feature values in data row(s) {rows}")
+        yield features.to_numpy(dtype=np.float64), chunk[target].to_numpy()
+
+# With an rng the file order and the rows within each chunk are shuffled, so
+# incremental models don't see the data in file order.
+def iter_chunks(files, target, feature_columns, chunksize, scaler=None, rng=None):
+    if rng is not None:
+        files = [files[i] for i in rng.permutation(len(files))]
+    for path in files:
+        for X, y in read_training_chunks(path, target, feature_columns, chunksize):
+            if scaler is not None:
+                X = scaler.transform(X)
+            if rng is not None:
+                order = rng.permutation(len(y))
+                X, y = X[order], y[order]
+            yield X, y
+
+# The scaler sees exactly the rows that are used for training
+def fit_scaler(files, target, feature_columns, chunksize):
+    scaler = StandardScaler()
+    for path in files:
+        for X, _ in read_training_chunks(path, target, feature_columns, chunksize):
+            scaler.partial_fit(X)
+    return scaler
+
+def get_feature_columns(files, target):
+    header = pd.read_csv(files[0], nrows=0).columns
+    if target not in header:
+        raise ValueError(f"Target column '{target}' not found in {files[0]}")
+    return [column for column in header if column not in DROP_COLUMNS and column != target]
+
+# partial_fit needs every class up front, so collect them from the target column only
+def get_classes(files, target, chunksize):
+    classes = set()
+    for path in files:
+        for chunk in pd.read_csv(path, usecols=[target], chunksize=chunksize):
+            classes.update(chunk[target].dropna().unique())
+    return np.array(sorted(classes))
+
+# Step 2: Train the model incrementally
+def train_incremental(model, files, target, feature_columns, classes, chunksize, scaler=None, seed=42):
+    rng = np.random.default_rng(seed)
+    for X, y in iter_chunks(files, target, feature_columns, chunksize, scaler=scaler, rng=rng):
+        model.partial_fit(X, y, classes=classes)
+    return model
+
+# Step 3: Evaluate the model; the confusion matrix is accumulated per chunk
+def evaluate_incremental(model, files, target, feature_columns, classes, chunksize, scaler=None):
+    matrix = np.zeros((len(classes), len(classes)), dtype=np.int64)
+    for X, y in iter_chunks(files, target, feature_columns, chunksize, scaler=scaler):
+        matrix += confusion_matrix(y, model.predict(X), labels=classes)
+    return matrix
+
+def metrics_from_confusion_matrix(matrix, classes):
+    true_positives = np.diag(matrix).astype(float)
+    support = matrix.sum(axis=1)
+    predicted = matrix.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.nan_to_num(true_positives / predicted)
+        recall = np.nan_to_num(true_positives / support)
+        f1 = np.nan_to_num(2 * precision * recall / (precision + recall))
+
+    total = matrix.sum()
+    return {
+        "samples": int(total),
+        "accuracy": float(true_positives.sum() / total) if total else 0.0,
+        "macro_f1": float(f1.mean()),
+        "per_class": {
+            str(label): {"precision": float(p), "recall": float(r), "f1": float(f), "support": int(s)}
+            for label, p, r, f, s in zip(classes, precision, recall, f1, support)
+        },
+    }
+
+def run_fold(fold, estimator, scale, train_files, valid_files, target, feature_columns, classes, chunksize):
+    start = time.perf_counter()
+    # The scaler only sees the fold's training files, so validation data doesn't leak into it
+    scaler = fit_scaler(train_files, target, feature_columns, chunksize) if scale else None
+    model = train_incremental(clone(estimator), train_files, target, feature_columns, classes, chunksize, scaler=scaler)
+    fit_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matrix = evaluate_incremental(model, valid_files, target, feature_columns, classes, chunksize, scaler=scaler)
+    eval_seconds = time.perf_counter() - start
+
+    metrics = metrics_from_confusion_matrix(matrix, classes)
+    metrics.update({"fold": fold, "validation_files": [os.path.basename(f) for f in valid_files],
+                    "fit_seconds": fit_seconds, "eval_seconds": eval_seconds})
+    return metrics
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train the student classifier on all class files")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="Directory containing the class CSV files")
+    parser.add_argument("--pattern", default="student_data_*.csv", help="Glob pattern for the class files")
+    parser.add_argument("--target", default="Category", help="Column containing the class labels")
+    parser.add_argument("--model", default="gaussian_nb", choices=list(MODELS.keys()), help="Incremental estimator to train")
+    parser.add_argument("--chunksize", type=int, default=10000, help="Rows read per chunk")
+    parser.add_argument("--folds", type=int, default=5, help="Number of cross-validation folds (groups of files)")
+    parser.add_argument("--jobs", type=int, default=-1, help="Folds trained in parallel (-1 uses all cores)")
+    parser.add_argument("--model-output", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "model.joblib"))
+    parser.add_argument("--metrics-output", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "training_metrics.json"))
+    args = parser.parse_args(argv)
+
+    total_start = time.perf_counter()
+    files = find_class_files(args.data_dir, args.pattern)
+    if not files:
+        parser.error(f"No files matching {args.pattern} in {args.data_dir}")
 
-# Step 1: Load the Data
-dataframes = [pd.read_csv(f"student_data_{i}.csv") for i in range(1, 31)]
+    try:
+        feature_columns = get_feature_columns(files, args.target)
+    except ValueError as e:
+        parser.error(str(e))
+    classes = get_classes(files, args.target, args.chunksize)
+    make_estimator, scale = MODELS[args.model]
+    estimator = make_estimator()
 
-# Step 2: Concatenate Datasets
-dataset = pd.concat(dataframes)
+    try:
+        # Step 4: Cross-validate, one fold per group of files, folds in parallel
+        folds = [list(group) for group in np.array_split(np.array(files), min(args.folds, len(files))) if len(group)]
+        fold_results = []
+        if len(folds) > 1:
+            fold_results = Parallel(n_jobs=args.jobs)(
+                delayed(run_fold)(i, estimator, scale, [f for f in files if f not in valid], valid, args.target, feature_columns, classes, args.chunksize)
+                for i, valid in enumerate(folds, start=1)
+            )
 
-# Step 3: Preprocess the Data
-# Assuming no preprocessing is needed in this example
+        # Step 5: Train the final model on every file
+        start = time.perf_counter()
+        scaler = fit_scaler(files, args.target, feature_columns, args.chunksize) if scale else None
+        model = train_incremental(clone(estimator), files, args.target, feature_columns, classes, args.chunksize, scaler=scaler)
+        final_fit_seconds = time.perf_counter() - start
+    except ValueError as e:
+        parser.exit(1, f"Training failed: {e}\n")
 
-# Step 4: Split the Data
-X = dataset.drop(columns=["Register Number", "First Name", "Last Name", "Age"])
-y = dataset["Category"]  # Assuming "Category" is the target variable containing the class labels
-X_train, X_valid, y_train, y_valid = train_test_split(X, y, test_size=0.2, random_state=42)
+    joblib.dump({"model": model, "scaler": scaler, "feature_columns": feature_columns, "classes": classes.tolist()}, args.model_output)
 
-# Step 5: Choose a Model
-classifier = GaussianNB()
+    results = {
+        "model": args.model,
+        "files": len(files),
+        "feature_columns": feature_columns,
+        "classes": [str(label) for label in classes],
+        "folds": fold_results,
+        "mean_accuracy": float(np.mean([f["accuracy"] for f in fold_results])) if fold_results else None,
+        "mean_macro_f1": float(np.mean([f["macro_f1"] for f in fold_results])) if fold_results else None,
+        "final_fit_seconds": final_fit_seconds,
+        "total_seconds": time.perf_counter() - total_start,
+    }
+    with open(args.metrics_output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
 
-# Step 6: Train the Model
-classifier.fit(X_train, y_train)
+    for fold in fold_results:
+        print(f"Fold {fold['fold']}: accuracy={fold['accuracy']:.3f} macro_f1={fold['macro_f1']:.3f} "
+              f"fit={fold['fit_seconds']:.2f}s eval={fold['eval_seconds']:.2f}s")
+    if fold_results:
+        print(f"Mean accuracy: {results['mean_accuracy']:.3f}, mean macro F1: {results['mean_macro_f1']:.3f}")
+    print(f"Model written to {args.model_output}, metrics written to {args.metrics_output}")
 
-# Step 7: Evaluate the Model
-predictions = classifier.predict(X_valid)
-report = classification_report(y_valid, predictions)
-print("Classification Report:")
-print(report)
+if __name__ == "__main__":
+    main()
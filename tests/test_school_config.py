@@ -0,0 +1,41 @@
+import io
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from school_config import SchoolConfig, load_config
+
+def _load(name, text):
+    config_file = io.BytesIO(text.encode("utf-8"))
+    config_file.name = name
+    return load_config(config_file)
+
+def test_empty_yaml_uses_defaults():
+    assert _load("school.yaml", "") == SchoolConfig()
+
+def test_empty_json_uses_defaults():
+    assert _load("school.json", "{}") == SchoolConfig()
+
+def test_subjects_only_keeps_matching_default_pathways():
+    config = _load("school.yaml", "subjects: [Mathematics, Integrated Science, Art]\n")
+    assert config.subjects == ("Mathematics", "Integrated Science", "Art")
+    assert config.pathway_dict() == {"STEM": ["Mathematics", "Integrated Science"]}
+
+def test_subjects_only_without_matching_pathways():
+    config = _load("school.json", '{"subjects": ["Art"]}')
+    assert config.pathway_dict() == {}
+
+@pytest.mark.parametrize("name, text", [
+    ("school.yaml", "subjects: [a\n  b: ]\n"),
+    ("school.yaml", "- a\n- b\n"),
+    ("school.json", "[1]"),
+    ("school.yaml", "subjects: [Arts]\npathways:\n  X:\n"),
+    ("school.yaml", "subjects: [Arts]\npathways:\n  X: Arts\n"),
+    ("school.yaml", "subjects: [Arts]\npathways:\n  X: [Music]\n"),
+])
+def test_malformed_config_raises_value_error(name, text):
+    with pytest.raises(ValueError):
+        _load(name, text)